@@ -44,7 +44,7 @@ class BlobAnnouncer:
                     self._submit_announcement(
                         self.announce_queue.pop()) for _ in range(batch_size) if self.announce_queue
                 ], loop=self.loop)
-                announced = list(filter(None, announced))
+                announced = [blob_hash for blob_hash in announced if blob_hash]
                 if announced:
                     await self.storage.update_last_announced_blobs(announced)
                     log.info("announced %i blobs", len(announced))
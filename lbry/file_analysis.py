@@ -403,7 +403,7 @@ class VideoFileAnalyzer:
 
         if not repair:
             errors = ["Streamability verification failed:"]
-            errors.extend(filter(None, messages))
+            errors.extend(message for message in messages if message)
             raise Exception("\n   ".join(errors))
 
         # the plan for transcoding:
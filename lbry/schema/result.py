@@ -1,7 +1,6 @@
 import base64
 import struct
 from typing import List
-from binascii import hexlify
 from itertools import chain
 
 from lbry.error import ResolveCensoredError
@@ -12,24 +11,29 @@ INVALID = ErrorMessage.Code.Name(ErrorMessage.INVALID)
 NOT_FOUND = ErrorMessage.Code.Name(ErrorMessage.NOT_FOUND)
 BLOCKED = ErrorMessage.Code.Name(ErrorMessage.BLOCKED)
 
+NOUT_STRUCT = struct.Struct('<I')
+
 
 def set_reference(reference, claim_hash, rows):
     if claim_hash:
         for txo in rows:
             if claim_hash == txo['claim_hash']:
-                reference.tx_hash = txo['txo_hash'][:32]
-                reference.nout = struct.unpack('<I', txo['txo_hash'][32:])[0]
+                txo_hash = txo['txo_hash']
+                reference.tx_hash = txo_hash[:32]
+                reference.nout, = NOUT_STRUCT.unpack_from(txo_hash, 32)
                 reference.height = txo['height']
                 return
 
 
 class Censor:
 
-    __slots__ = 'streams', 'channels', 'limit_claims_per_channel', 'censored', 'claims_in_channel', 'total'
+    __slots__ = 'streams', 'channels', 'is_censoring', 'limit_claims_per_channel', \
+                'censored', 'claims_in_channel', 'total'
 
     def __init__(self, streams: dict = None, channels: dict = None, limit_claims_per_channel: int = None):
         self.streams = streams or {}
         self.channels = channels or {}
+        self.is_censoring = bool(self.streams or self.channels)
         self.limit_claims_per_channel = limit_claims_per_channel  # doesn't count as censored
         self.censored = {}
         self.claims_in_channel = {}
@@ -37,18 +41,19 @@ class Censor:
 
     def censor(self, row) -> bool:
         was_censored = False
-        for claim_hash, lookup in (
-                (row['claim_hash'], self.streams),
-                (row['claim_hash'], self.channels),
-                (row['channel_hash'], self.channels),
-                (row['reposted_claim_hash'], self.streams),
-                (row['reposted_claim_hash'], self.channels)):
-            censoring_channel_hash = lookup.get(claim_hash)
-            if censoring_channel_hash:
-                was_censored = True
-                self.censored.setdefault(censoring_channel_hash, 0)
-                self.censored[censoring_channel_hash] += 1
-                break
+        if self.is_censoring:
+            for claim_hash, lookup in (
+                    (row['claim_hash'], self.streams),
+                    (row['claim_hash'], self.channels),
+                    (row['channel_hash'], self.channels),
+                    (row['reposted_claim_hash'], self.streams),
+                    (row['reposted_claim_hash'], self.channels)):
+                censoring_channel_hash = lookup.get(claim_hash)
+                if censoring_channel_hash:
+                    was_censored = True
+                    self.censored.setdefault(censoring_channel_hash, 0)
+                    self.censored[censoring_channel_hash] += 1
+                    break
         if was_censored:
             self.total += 1
         if not was_censored and self.limit_claims_per_channel is not None and row['channel_hash']:
@@ -155,7 +160,7 @@ class Outputs:
         for txo_message in chain(outputs.txos, outputs.extra_txos):
             if txo_message.WhichOneof('meta') == 'error':
                 continue
-            txs.add((hexlify(txo_message.tx_hash[::-1]).decode(), txo_message.height))
+            txs.add((txo_message.tx_hash[::-1].hex(), txo_message.height))
         return cls(
             outputs.txos, outputs.extra_txos, txs,
             outputs.offset, outputs.total,
@@ -192,8 +197,9 @@ class Outputs:
                 txo_message.error.code = ErrorMessage.BLOCKED
                 set_reference(txo_message.error.blocked.channel, txo.censor_hash, extra_txo_rows)
             return
-        txo_message.tx_hash = txo['txo_hash'][:32]
-        txo_message.nout, = struct.unpack('<I', txo['txo_hash'][32:])
+        txo_hash = txo['txo_hash']
+        txo_message.tx_hash = txo_hash[:32]
+        txo_message.nout, = NOUT_STRUCT.unpack_from(txo_hash, 32)
         txo_message.height = txo['height']
         txo_message.claim.short_url = txo['short_url']
         txo_message.claim.reposted = txo['reposted']
@@ -235,22 +235,21 @@ class LRUCacheWithMetrics:
 
     def get(self, key, default=None):
         try:
-            value = self.cache.pop(key)
+            value = self.cache[key]
             if self._track_metrics:
                 self.hits.inc()
         except KeyError:
             if self._track_metrics:
                 self.misses.inc()
             return default
-        self.cache[key] = value
+        self.cache.move_to_end(key)
         return value
 
     def set(self, key, value):
-        try:
-            self.cache.pop(key)
-        except KeyError:
-            if len(self.cache) >= self.capacity:
-                self.cache.popitem(last=False)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.capacity:
+            self.cache.popitem(last=False)
         self.cache[key] = value
 
     def clear(self):
@@ -296,18 +295,17 @@ class LRUCache:
 
     def get(self, key, default=None):
         try:
-            value = self.cache.pop(key)
+            value = self.cache[key]
         except KeyError:
             return default
-        self.cache[key] = value
+        self.cache.move_to_end(key)
         return value
 
     def set(self, key, value):
-        try:
-            self.cache.pop(key)
-        except KeyError:
-            if len(self.cache) >= self.capacity:
-                self.cache.popitem(last=False)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.capacity:
+            self.cache.popitem(last=False)
         self.cache[key] = value
 
     def clear(self):
@@ -791,6 +791,7 @@ class LBRYBlockProcessor(BlockProcessor):
         finally:
             self.sql.commit()
         if self.db.first_sync and self.height == self.daemon.cached_height():
+            self.timer.run(self.sql.execute, 'pragma synchronous=full;', timer_name='restoring synchronous pragma')
             self.timer.run(self.sql.execute, self.sql.SEARCH_INDEXES, timer_name='executing SEARCH_INDEXES')
             if self.env.individual_tag_indexes:
                 self.timer.run(self.sql.execute, self.sql.TAG_INDEXES, timer_name='executing TAG_INDEXES')
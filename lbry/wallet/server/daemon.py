@@ -54,10 +54,14 @@ class Daemon:
         self._height = None
         self.available_rpcs = {}
         self.connector = aiohttp.TCPConnector()
+        self._session: aiohttp.ClientSession = None
         self._block_hash_cache = LRUCacheWithMetrics(100000)
         self._block_cache = LRUCacheWithMetrics(2 ** 16, metric_name='block', namespace=NAMESPACE)
 
     async def close(self):
+        if self._session:
+            await self._session.close()
+            self._session = None
         if self.connector:
             await self.connector.close()
             self.connector = None
@@ -94,25 +98,27 @@ class Daemon:
         return False
 
     def client_session(self):
-        """An aiohttp client session."""
-        return aiohttp.ClientSession(connector=self.connector, connector_owner=False)
+        """The aiohttp client session, created on first use."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(connector=self.connector, connector_owner=False)
+        return self._session
 
     async def _send_data(self, data):
         if not self.connector:
             raise asyncio.CancelledError('Tried to send request during shutdown.')
         async with self.workqueue_semaphore:
-            async with self.client_session() as session:
-                async with session.post(self.current_url(), data=data) as resp:
-                    kind = resp.headers.get('Content-Type', None)
-                    if kind == 'application/json':
-                        return await resp.json()
-                    # bitcoind's HTTP protocol "handling" is a bad joke
-                    text = await resp.text()
-                    if 'Work queue depth exceeded' in text:
-                        raise WorkQueueFullError
-                    text = text.strip() or resp.reason
-                    self.logger.error(text)
-                    raise DaemonError(text)
+            session = self.client_session()
+            async with session.post(self.current_url(), data=data) as resp:
+                kind = resp.headers.get('Content-Type', None)
+                if kind == 'application/json':
+                    return await resp.json()
+                # bitcoind's HTTP protocol "handling" is a bad joke
+                text = await resp.text()
+                if 'Work queue depth exceeded' in text:
+                    raise WorkQueueFullError
+                text = text.strip() or resp.reason
+                self.logger.error(text)
+                raise DaemonError(text)
 
     async def _send(self, payload, processor):
         """Send a payload to be converted to JSON.
@@ -132,7 +138,9 @@ class Daemon:
 
         on_good_message = None
         last_error_log = 0
-        data = json.dumps(payload)
+        # compact separators: vector payloads (e.g. a getblock per height) are
+        # large and the default encoding pads every delimiter with a space
+        data = json.dumps(payload, separators=(',', ':'))
         retry = self.init_retry
         methods = tuple(
             [payload['method']] if isinstance(payload, dict) else [request['method'] for request in payload]
@@ -303,6 +311,11 @@ class Daemon:
         # Convert hex strings to bytes
         return [hex_to_bytes(tx) if tx else None for tx in txs]
 
+    async def getrawtransactions_verbose(self, hex_hashes):
+        """Return verbose transaction info dicts for the given hashes."""
+        params_iterable = ((hex_hash, 1) for hex_hash in hex_hashes)
+        return await self._send_vector('getrawtransaction', params_iterable)
+
     async def broadcast_transaction(self, raw_tx):
         """Broadcast a transaction to the network."""
         return await self._send_single('sendrawtransaction', (raw_tx, ))
@@ -1,21 +1,18 @@
 import time
-import struct
 import apsw
 import logging
-from operator import itemgetter
 from typing import Tuple, List, Dict, Union, Type, Optional
 from binascii import unhexlify
 from decimal import Decimal
 from contextvars import ContextVar
 from functools import wraps
-from itertools import chain
 from dataclasses import dataclass
 
 from lbry.wallet.database import query, interpolate
 from lbry.error import ResolveCensoredError
 from lbry.schema.url import URL, normalize_name
 from lbry.schema.tags import clean_tags
-from lbry.schema.result import Outputs, Censor
+from lbry.schema.result import Outputs, Censor, NOUT_STRUCT
 from lbry.wallet import Ledger, RegTestLedger
 
 from .common import CLAIM_TYPES, STREAM_TYPES, COMMON_TAGS, INDEXED_LANGUAGES
@@ -36,6 +33,8 @@ class SQLiteInterruptedError(apsw.InterruptError):
 
 ATTRIBUTE_ARRAY_MAX_LENGTH = 100
 
+INDEXED_LANGUAGE_SET = frozenset(INDEXED_LANGUAGES)
+
 INTEGER_PARAMS = {
     'height', 'creation_height', 'activation_height', 'expiration_height',
     'timestamp', 'creation_timestamp', 'duration', 'release_time', 'fee_amount',
@@ -62,6 +61,9 @@ ORDER_FIELDS = {
 } | INTEGER_PARAMS
 
 
+RANGE_OPS = {'<=': '__lte', '>=': '__gte', '<': '__lt', '>': '__gt'}
+
+
 @dataclass
 class ReaderState:
     db: apsw.Connection
@@ -186,9 +188,15 @@ def execute_query(sql, values, row_offset: int, row_limit: int, censor: Censor)
     context.set_query_timeout()
     try:
         c = context.db.cursor()
+        columns = None
         def row_filter(cursor, row):
-            nonlocal row_offset
-            row = row_factory(cursor, row)
+            nonlocal row_offset, columns
+            if columns is None:
+                columns = [description[0] for description in cursor.getdescription()]
+            row = {
+                column: (set(value.split(',')) if column == 'tags' else value)
+                for column, value in zip(columns, row)
+            }
             if len(row) > 1 and censor.censor(row):
                 return
             if row_offset:
@@ -214,6 +222,130 @@ def execute_query(sql, values, row_offset: int, row_limit: int, censor: Censor)
         raise SQLiteOperationalError(context.metrics)
 
 
+def _constrain_claim_id(constraints):
+    claim_id = constraints.pop('claim_id')
+    if len(claim_id) == 40:
+        constraints['claim.claim_id'] = claim_id
+    else:
+        constraints['claim.claim_id__like'] = f'{claim_id[:40]}%'
+
+
+def _constrain_claim_ids(constraints):
+    constraints['claim.claim_id__in'] = set(constraints.pop('claim_ids'))
+
+
+def _constrain_reposted_claim_id(constraints):
+    constraints['claim.reposted_claim_hash'] = unhexlify(constraints.pop('reposted_claim_id'))[::-1]
+
+
+def _constrain_name(constraints):
+    constraints['claim.normalized'] = normalize_name(constraints.pop('name'))
+
+
+def _constrain_public_key_id(constraints):
+    constraints['claim.public_key_hash'] = (
+        ctx.get().ledger.address_to_hash160(constraints.pop('public_key_id')))
+
+
+def _constrain_channel_hash(constraints):
+    constraints['claim.channel_hash'] = constraints.pop('channel_hash')
+
+
+def _constrain_channel_ids(constraints):
+    channel_ids = constraints.pop('channel_ids')
+    if channel_ids:
+        constraints['claim.channel_hash__in'] = {
+            unhexlify(cid)[::-1] for cid in channel_ids if cid
+        }
+
+
+def _constrain_not_channel_ids(constraints):
+    not_channel_ids = constraints.pop('not_channel_ids')
+    if not_channel_ids:
+        not_channel_ids_binary = {
+            unhexlify(ncid)[::-1] for ncid in not_channel_ids
+        }
+        constraints['claim.claim_hash__not_in#not_channel_ids'] = not_channel_ids_binary
+        if constraints.get('has_channel_signature', False):
+            constraints['claim.channel_hash__not_in'] = not_channel_ids_binary
+        else:
+            constraints['null_or_not_channel__or'] = {
+                'claim.signature_valid__is_null': True,
+                'claim.channel_hash__not_in': not_channel_ids_binary
+            }
+
+
+def _constrain_signature_valid(constraints):
+    has_channel_signature = constraints.pop('has_channel_signature', False)
+    if has_channel_signature:
+        constraints['claim.signature_valid'] = constraints.pop('signature_valid')
+    else:
+        constraints['null_or_signature__or'] = {
+            'claim.signature_valid__is_null': True,
+            'claim.signature_valid': constraints.pop('signature_valid')
+        }
+
+
+def _constrain_has_channel_signature(constraints):
+    if constraints.pop('has_channel_signature', False):
+        constraints['claim.signature_valid__is_not_null'] = True
+
+
+def _constrain_txid(constraints):
+    tx_hash = unhexlify(constraints.pop('txid'))[::-1]
+    nout = constraints.pop('nout', 0)
+    constraints['claim.txo_hash'] = tx_hash + NOUT_STRUCT.pack(nout)
+
+
+def _constrain_claim_type(constraints):
+    claim_types = constraints.pop('claim_type')
+    if isinstance(claim_types, str):
+        claim_types = [claim_types]
+    if claim_types:
+        constraints['claim.claim_type__in'] = {
+            CLAIM_TYPES[claim_type] for claim_type in claim_types
+        }
+
+
+def _constrain_stream_types(constraints):
+    stream_types = constraints.pop('stream_types')
+    if stream_types:
+        constraints['claim.stream_type__in'] = {
+            STREAM_TYPES[stream_type] for stream_type in stream_types
+        }
+
+
+def _constrain_media_types(constraints):
+    media_types = constraints.pop('media_types')
+    if media_types:
+        constraints['claim.media_type__in'] = set(media_types)
+
+
+def _constrain_fee_currency(constraints):
+    constraints['claim.fee_currency'] = constraints.pop('fee_currency').lower()
+
+
+# processed in order; 'not_channel_ids' must see 'has_channel_signature'
+# before the signature transforms consume it
+CONSTRAINT_TRANSFORMS = (
+    ('claim_id', _constrain_claim_id),
+    ('claim_ids', _constrain_claim_ids),
+    ('reposted_claim_id', _constrain_reposted_claim_id),
+    ('name', _constrain_name),
+    ('public_key_id', _constrain_public_key_id),
+    ('channel_hash', _constrain_channel_hash),
+    ('channel_ids', _constrain_channel_ids),
+    ('not_channel_ids', _constrain_not_channel_ids),
+    ('signature_valid', _constrain_signature_valid),
+    ('has_channel_signature', _constrain_has_channel_signature),
+    ('txid', _constrain_txid),
+    ('claim_type', _constrain_claim_type),
+    ('stream_types', _constrain_stream_types),
+    ('media_types', _constrain_media_types),
+    ('fee_currency', _constrain_fee_currency),
+)
+
+
 def claims_query(cols, for_count=False, **constraints) -> Tuple[str, Dict]:
     if 'order_by' in constraints:
         order_by_parts = constraints['order_by']
@@ -232,19 +364,17 @@ def claims_query(cols, for_count=False, **constraints) -> Tuple[str, Dict]:
             )
         constraints['order_by'] = sql_order_by
 
-    ops = {'<=': '__lte', '>=': '__gte', '<': '__lt', '>': '__gt'}
-    for constraint in INTEGER_PARAMS:
-        if constraint in constraints:
-            value = constraints.pop(constraint)
-            postfix = ''
-            if isinstance(value, str):
-                if len(value) >= 2 and value[:2] in ops:
-                    postfix, value = ops[value[:2]], value[2:]
-                elif len(value) >= 1 and value[0] in ops:
-                    postfix, value = ops[value[0]], value[1:]
-            if constraint == 'fee_amount':
-                value = Decimal(value)*1000
-            constraints[f'claim.{constraint}{postfix}'] = int(value)
+    for constraint in INTEGER_PARAMS.intersection(constraints):
+        value = constraints.pop(constraint)
+        postfix = ''
+        if isinstance(value, str):
+            if len(value) >= 2 and value[:2] in RANGE_OPS:
+                postfix, value = RANGE_OPS[value[:2]], value[2:]
+            elif len(value) >= 1 and value[0] in RANGE_OPS:
+                postfix, value = RANGE_OPS[value[0]], value[1:]
+        if constraint == 'fee_amount':
+            value = Decimal(value)*1000
+        constraints[f'claim.{constraint}{postfix}'] = int(value)
 
     if constraints.pop('is_controlling', False):
         if {'sequence', 'amount_order'}.isdisjoint(constraints):
@@ -259,84 +389,9 @@ def claims_query(cols, for_count=False, **constraints) -> Tuple[str, Dict]:
         constraints['offset'] = int(constraints.pop('amount_order')) - 1
         constraints['limit'] = 1
 
-    if 'claim_id' in constraints:
-        claim_id = constraints.pop('claim_id')
-        if len(claim_id) == 40:
-            constraints['claim.claim_id'] = claim_id
-        else:
-            constraints['claim.claim_id__like'] = f'{claim_id[:40]}%'
-    elif 'claim_ids' in constraints:
-        constraints['claim.claim_id__in'] = set(constraints.pop('claim_ids'))
-
-    if 'reposted_claim_id' in constraints:
-        constraints['claim.reposted_claim_hash'] = unhexlify(constraints.pop('reposted_claim_id'))[::-1]
-
-    if 'name' in constraints:
-        constraints['claim.normalized'] = normalize_name(constraints.pop('name'))
-
-    if 'public_key_id' in constraints:
-        constraints['claim.public_key_hash'] = (
-            ctx.get().ledger.address_to_hash160(constraints.pop('public_key_id')))
-    if 'channel_hash' in constraints:
-        constraints['claim.channel_hash'] = constraints.pop('channel_hash')
-    if 'channel_ids' in constraints:
-        channel_ids = constraints.pop('channel_ids')
-        if channel_ids:
-            constraints['claim.channel_hash__in'] = {
-                unhexlify(cid)[::-1] for cid in channel_ids if cid
-            }
-    if 'not_channel_ids' in constraints:
-        not_channel_ids = constraints.pop('not_channel_ids')
-        if not_channel_ids:
-            not_channel_ids_binary = {
-                unhexlify(ncid)[::-1] for ncid in not_channel_ids
-            }
-            constraints['claim.claim_hash__not_in#not_channel_ids'] = not_channel_ids_binary
-            if constraints.get('has_channel_signature', False):
-                constraints['claim.channel_hash__not_in'] = not_channel_ids_binary
-            else:
-                constraints['null_or_not_channel__or'] = {
-                    'claim.signature_valid__is_null': True,
-                    'claim.channel_hash__not_in': not_channel_ids_binary
-                }
-    if 'signature_valid' in constraints:
-        has_channel_signature = constraints.pop('has_channel_signature', False)
-        if has_channel_signature:
-            constraints['claim.signature_valid'] = constraints.pop('signature_valid')
-        else:
-            constraints['null_or_signature__or'] = {
-                'claim.signature_valid__is_null': True,
-                'claim.signature_valid': constraints.pop('signature_valid')
-            }
-    elif constraints.pop('has_channel_signature', False):
-        constraints['claim.signature_valid__is_not_null'] = True
-
-    if 'txid' in constraints:
-        tx_hash = unhexlify(constraints.pop('txid'))[::-1]
-        nout = constraints.pop('nout', 0)
-        constraints['claim.txo_hash'] = tx_hash + struct.pack('<I', nout)
-
-    if 'claim_type' in constraints:
-        claim_types = constraints.pop('claim_type')
-        if isinstance(claim_types, str):
-            claim_types = [claim_types]
-        if claim_types:
-            constraints['claim.claim_type__in'] = {
-                CLAIM_TYPES[claim_type] for claim_type in claim_types
-            }
-    if 'stream_types' in constraints:
-        stream_types = constraints.pop('stream_types')
-        if stream_types:
-            constraints['claim.stream_type__in'] = {
-                STREAM_TYPES[stream_type] for stream_type in stream_types
-            }
-    if 'media_types' in constraints:
-        media_types = constraints.pop('media_types')
-        if media_types:
-            constraints['claim.media_type__in'] = set(media_types)
-
-    if 'fee_currency' in constraints:
-        constraints['claim.fee_currency'] = constraints.pop('fee_currency').lower()
+    for key, transform in CONSTRAINT_TRANSFORMS:
+        if key in constraints:
+            transform(constraints)
 
     _apply_constraints_for_array_attributes(constraints, 'tag', clean_tags, for_count)
     _apply_constraints_for_array_attributes(constraints, 'language', lambda _: _, for_count)
@@ -398,16 +453,17 @@ def search_claims(censor: Censor, **constraints) -> List:
 
 def _get_referenced_rows(txo_rows: List[dict], censor_channels: List[bytes]):
     censor = ctx.get().get_resolve_censor()
-    repost_hashes = set(filter(None, map(itemgetter('reposted_claim_hash'), txo_rows)))
-    channel_hashes = set(chain(
-        filter(None, map(itemgetter('channel_hash'), txo_rows)),
-        censor_channels
-    ))
+    repost_hashes, channel_hashes = set(), set(censor_channels)
+    for row in txo_rows:
+        if row['reposted_claim_hash']:
+            repost_hashes.add(row['reposted_claim_hash'])
+        if row['channel_hash']:
+            channel_hashes.add(row['channel_hash'])
 
     reposted_txos = []
     if repost_hashes:
         reposted_txos = search_claims(censor, **{'claim.claim_hash__in': repost_hashes})
-        channel_hashes |= set(filter(None, map(itemgetter('channel_hash'), reposted_txos)))
+        channel_hashes.update(row['channel_hash'] for row in reposted_txos if row['channel_hash'])
 
     channel_txos = []
     if channel_hashes:
@@ -435,7 +491,12 @@ def search(constraints) -> Tuple[List, List, int, int, Censor]:
 
 @measure
 def resolve(urls) -> Tuple[List, List]:
-    txo_rows = [resolve_url(raw_url) for raw_url in urls]
+    resolved = {}
+    channel_cache = {}
+    for raw_url in urls:
+        if raw_url not in resolved:
+            resolved[raw_url] = resolve_url(raw_url, channel_cache)
+    txo_rows = [resolved[raw_url] for raw_url in urls]
     extra_txo_rows = _get_referenced_rows(
         [txo for txo in txo_rows if isinstance(txo, dict)],
         [txo.censor_hash for txo in txo_rows if isinstance(txo, ResolveCensoredError)]
@@ -444,7 +505,7 @@ def resolve(urls) -> Tuple[List, List]:
 
 
 @measure
-def resolve_url(raw_url):
+def resolve_url(raw_url, channel_cache: Optional[Dict] = None):
     censor = ctx.get().get_resolve_censor()
 
     try:
@@ -460,13 +521,33 @@ def resolve_url(raw_url):
             query['is_controlling'] = True
         else:
             query['order_by'] = ['^creation_height']
-        matches = search_claims(censor, **query, limit=1)
-        if matches:
-            channel = matches[0]
-        elif censor.censored:
-            return ResolveCensoredError(raw_url, next(iter(censor.censored)))
+        if url.has_stream:
+            # the channel row is only consulted for its claim_hash before
+            # running the stream query (clients get the full channel row
+            # from the referenced rows lookup), so skip the other columns;
+            # censoring still needs the channel and repost hashes
+            cols = 'claim.claim_hash, claim.channel_hash, claim.reposted_claim_hash'
         else:
-            return LookupError(f'Could not find channel in "{raw_url}".')
+            cols = None
+        cache_key = None
+        if channel_cache is not None:
+            # urls in a batch frequently share a channel, so only look
+            # each channel up once per batch
+            cache_key = str((cols is None, sorted(query.items())))
+            channel = channel_cache.get(cache_key)
+        if channel is None:
+            if cols is not None:
+                matches = select_claims(censor, cols, **query, limit=1)
+            else:
+                matches = search_claims(censor, **query, limit=1)
+            if matches:
+                channel = matches[0]
+                if cache_key is not None:
+                    channel_cache[cache_key] = channel
+            elif censor.censored:
+                return ResolveCensoredError(raw_url, next(iter(censor.censored)))
+            else:
+                return LookupError(f'Could not find channel in "{raw_url}".')
 
     if url.has_stream:
         query = url.stream.to_dict()
@@ -537,7 +618,7 @@ def _apply_constraints_for_array_attributes(constraints, attr, cleaner, for_coun
             )
             """
     elif attr == 'language':
-        indexed_languages = any_items & set(INDEXED_LANGUAGES)
+        indexed_languages = any_items & INDEXED_LANGUAGE_SET
         if indexed_languages:
             any_items -= indexed_languages
         for language in indexed_languages:
@@ -233,6 +233,10 @@ class SQLDB:
             return True
         self.db.setexectrace(exec_factory)
         self.execute(self.PRAGMAS)
+        if self.main.first_sync:
+            # no readers and the db is rebuilt from the chain on corruption,
+            # so trade durability for initial sync throughput
+            self.execute('pragma synchronous=off;')
         self.execute(self.CREATE_TABLES_QUERY)
         register_canonical_functions(self.db)
         self.state_manager = Manager()
@@ -251,34 +255,34 @@ class SQLDB:
             self.state_manager.shutdown()
 
     def update_blocked_and_filtered_claims(self):
-        self.update_claims_from_channel_hashes(
-            self.blocked_streams, self.blocked_channels, self.blocking_channel_hashes
-        )
-        self.update_claims_from_channel_hashes(
-            self.filtered_streams, self.filtered_channels, self.filtering_channel_hashes
-        )
-        self.filtered_streams.update(self.blocked_streams)
-        self.filtered_channels.update(self.blocked_channels)
-
-    def update_claims_from_channel_hashes(self, shared_streams, shared_channels, channel_hashes):
-        streams, channels = {}, {}
+        blocked_streams, blocked_channels = {}, {}
+        filtered_streams, filtered_channels = {}, {}
+        channel_hashes = self.blocking_channel_hashes | self.filtering_channel_hashes
         if channel_hashes:
             sql = query(
                 "SELECT repost.channel_hash, repost.reposted_claim_hash, target.claim_type "
                 "FROM claim as repost JOIN claim AS target ON (target.claim_hash=repost.reposted_claim_hash)", **{
                     'repost.reposted_claim_hash__is_not_null': 1,
-                    'repost.channel_hash__in': channel_hashes
+                    'repost.channel_hash__in': channel_hashes,
+                    'target.claim_type__in': {CLAIM_TYPES['stream'], CLAIM_TYPES['channel']}
                 }
             )
+            blocked_by_type = {CLAIM_TYPES['stream']: blocked_streams, CLAIM_TYPES['channel']: blocked_channels}
+            filtered_by_type = {CLAIM_TYPES['stream']: filtered_streams, CLAIM_TYPES['channel']: filtered_channels}
             for blocked_claim in self.execute(*sql):
-                if blocked_claim.claim_type == CLAIM_TYPES['stream']:
-                    streams[blocked_claim.reposted_claim_hash] = blocked_claim.channel_hash
-                elif blocked_claim.claim_type == CLAIM_TYPES['channel']:
-                    channels[blocked_claim.reposted_claim_hash] = blocked_claim.channel_hash
-        shared_streams.clear()
-        shared_streams.update(streams)
-        shared_channels.clear()
-        shared_channels.update(channels)
+                if blocked_claim.channel_hash in self.blocking_channel_hashes:
+                    blocked_by_type[blocked_claim.claim_type][
+                        blocked_claim.reposted_claim_hash] = blocked_claim.channel_hash
+                if blocked_claim.channel_hash in self.filtering_channel_hashes:
+                    filtered_by_type[blocked_claim.claim_type][
+                        blocked_claim.reposted_claim_hash] = blocked_claim.channel_hash
+        filtered_streams.update(blocked_streams)
+        filtered_channels.update(blocked_channels)
+        for shared, updated in (
+                (self.blocked_streams, blocked_streams), (self.blocked_channels, blocked_channels),
+                (self.filtered_streams, filtered_streams), (self.filtered_channels, filtered_channels)):
+            shared.clear()
+            shared.update(updated)
 
     @staticmethod
     def _insert_sql(table: str, data: dict) -> Tuple[str, list]:
@@ -421,6 +425,14 @@ class SQLDB:
     def insert_claims(self, txos: List[Output], header):
         claims = self._upsertable_claims(txos, header)
         if claims:
+            # claimtrie is only modified on takeover processing, so one membership
+            # query covers the whole batch instead of a subquery per inserted row
+            taken_names = {r.normalized for r in self.execute(*query(
+                "SELECT normalized FROM claimtrie",
+                normalized__in={claim['normalized'] for claim in claims}
+            )).fetchall()}
+            for claim in claims:
+                claim['activation_height'] = None if claim['normalized'] in taken_names else claim['height']
             self.executemany("""
                 INSERT OR IGNORE INTO claim (
                     claim_hash, claim_id, claim_name, normalized, txo_hash, tx_position, amount,
@@ -432,7 +444,7 @@ class SQLDB:
                     :claim_type, :media_type, :stream_type, :timestamp, :timestamp, :has_source,
                     :fee_currency, :fee_amount, :title, :description, :author, :duration, :height, :reposted_claim_hash, :height,
                     CASE WHEN :release_time IS NOT NULL THEN :release_time ELSE :timestamp END,
-                    CASE WHEN :normalized NOT IN (SELECT normalized FROM claimtrie) THEN :height END,
+                    :activation_height,
                     CASE WHEN :height >= 137181 THEN :height+2102400 ELSE :height+262974 END,
                     :claim_name||COALESCE(
                         (SELECT shortest_id(claim_id, :claim_id) FROM claim WHERE normalized = :normalized),
@@ -465,14 +477,14 @@ class SQLDB:
             return {r.channel_hash for r in affected_channels}
         return set()
 
+    DELETE_BATCH_SIZE = 500
+
     def delete_claims_above_height(self, height: int):
         claim_hashes = [x[0] for x in self.execute(
             "SELECT claim_hash FROM claim WHERE height>?", (height, )
         ).fetchall()]
-        while claim_hashes:
-            batch = set(claim_hashes[:500])
-            claim_hashes = claim_hashes[500:]
-            self.delete_claims(batch)
+        for start in range(0, len(claim_hashes), self.DELETE_BATCH_SIZE):
+            self.delete_claims(set(claim_hashes[start:start+self.DELETE_BATCH_SIZE]))
 
     def _clear_claim_metadata(self, claim_hashes: Set[bytes]):
         if claim_hashes:
@@ -877,19 +889,21 @@ class SQLDB:
         expire_timer.stop()
 
         r = timer.run
+        fts_cursor = self.db.cursor()
+        updated_fts_claim_hashes = [txo.claim_hash for txo in update_claims]
         r(update_full_text_search, 'before-delete',
-          delete_claim_hashes, self.db.cursor(), self.main.first_sync)
+          delete_claim_hashes, fts_cursor, self.main.first_sync)
         affected_channels = r(self.delete_claims, delete_claim_hashes)
         r(self.delete_supports, delete_support_txo_hashes)
         r(self.insert_claims, insert_claims, header)
         r(self.calculate_reposts, insert_claims)
         r(update_full_text_search, 'after-insert',
-          [txo.claim_hash for txo in insert_claims], self.db.cursor(), self.main.first_sync)
+          [txo.claim_hash for txo in insert_claims], fts_cursor, self.main.first_sync)
         r(update_full_text_search, 'before-update',
-          [txo.claim_hash for txo in update_claims], self.db.cursor(), self.main.first_sync)
+          updated_fts_claim_hashes, fts_cursor, self.main.first_sync)
         r(self.update_claims, update_claims, header)
         r(update_full_text_search, 'after-update',
-          [txo.claim_hash for txo in update_claims], self.db.cursor(), self.main.first_sync)
+          updated_fts_claim_hashes, fts_cursor, self.main.first_sync)
         r(self.validate_channel_signatures, height, insert_claims,
           update_claims, delete_claim_hashes, affected_channels, forward_timer=True)
         r(self.insert_supports, insert_supports)
@@ -1032,7 +1032,12 @@ class LBRYElectrumX(SessionBase):
         metrics = self.get_metrics_or_placeholder_for_api(query_name)
         metrics.start()
         cache = self.session_mgr.search_cache[query_name]
-        cache_key = str(kwargs)
+        if isinstance(kwargs, dict):
+            # canonicalize so the same query cached for one client is
+            # a hit for every client, regardless of argument order
+            cache_key = str(sorted(kwargs.items()))
+        else:
+            cache_key = str(kwargs)
         cache_item = cache.get(cache_key)
         if cache_item is None:
             cache_item = cache[cache_key] = ResultCacheItem()
@@ -1534,23 +1539,26 @@ class LBRYElectrumX(SessionBase):
         batch_result = await self.db.fs_transactions(tx_hashes)
         needed_merkles = {}
 
-        for tx_hash in tx_hashes:
-            if tx_hash in batch_result and batch_result[tx_hash][0]:
-                continue
-            tx_info = await self.daemon_request('getrawtransaction', tx_hash, True)
-            raw_tx = tx_info['hex']
-            block_hash = tx_info.get('blockhash')
-            if block_hash:
-                block = await self.daemon.deserialised_block(block_hash)
-                height = block['height']
-                try:
-                    pos = block['tx'].index(tx_hash)
-                except ValueError:
-                    raise RPCError(BAD_REQUEST, f'tx hash {tx_hash} not in '
-                                                f'block {block_hash} at height {height:,d}')
-                needed_merkles[tx_hash] = raw_tx, block['tx'], pos, height
-            else:
-                batch_result[tx_hash] = [raw_tx, {'block_height': -1}]
+        missing = [
+            tx_hash for tx_hash in dict.fromkeys(tx_hashes)
+            if not (tx_hash in batch_result and batch_result[tx_hash][0])
+        ]
+        if missing:
+            tx_infos = await self.daemon_request('getrawtransactions_verbose', missing)
+            for tx_hash, tx_info in zip(missing, tx_infos):
+                raw_tx = tx_info['hex']
+                block_hash = tx_info.get('blockhash')
+                if block_hash:
+                    block = await self.daemon.deserialised_block(block_hash)
+                    height = block['height']
+                    try:
+                        pos = block['tx'].index(tx_hash)
+                    except ValueError:
+                        raise RPCError(BAD_REQUEST, f'tx hash {tx_hash} not in '
+                                                    f'block {block_hash} at height {height:,d}')
+                    needed_merkles[tx_hash] = raw_tx, block['tx'], pos, height
+                else:
+                    batch_result[tx_hash] = [raw_tx, {'block_height': -1}]
 
         if needed_merkles:
             for tx_hash, (raw_tx, block_txs, pos, block_height) in needed_merkles.items():